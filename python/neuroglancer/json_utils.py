@@ -51,6 +51,51 @@ def decode_json(x):
     return json.loads(x)
 
 
+_plain_json_types = frozenset([str, int, float, bool, type(None)])
+
+
+def _encode_json_key(key):
+    if isinstance(key, str):
+        return str(key)
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        return int.__repr__(key)
+    if isinstance(key, float):
+        return json.dumps(float(key))
+    raise TypeError(
+        f"keys must be str, int, float, bool or None, not {type(key).__name__}"
+    )
+
+
+def to_plain_json(obj, default=json_encoder_default):
+    """Converts `obj` to plain JSON values.
+
+    Equivalent to ``decode_json(json.dumps(obj, default=default))``, but
+    without serializing to an intermediate string.
+    """
+    if type(obj) in _plain_json_types:
+        return obj
+    if isinstance(obj, dict):
+        return {
+            _encode_json_key(key): to_plain_json(value, default)
+            for key, value in obj.items()
+        }
+    if isinstance(obj, list | tuple):
+        return [to_plain_json(value, default) for value in obj]
+    if isinstance(obj, str):
+        return str(obj)
+    if isinstance(obj, int):
+        return int(obj)
+    if isinstance(obj, float):
+        return float(obj)
+    return to_plain_json(default(obj), default)
+
+
 def encode_json(obj):
     return json.dumps(obj, default=json_encoder_default)
 
@@ -331,6 +331,9 @@ class AnnotationReader:
             viewer_state.AnnotationPropertySpec(prop)
             for prop in self.metadata.get("properties", [])
         ]
+        self._property_fields = tuple(
+            f"property{i}" for i in range(len(self.properties))
+        )
         self._dtype = write_annotations._get_dtype_for_geometry(
             self.annotation_type, self.coordinate_space.rank
         ) + write_annotations._get_dtype_for_properties(self.properties)
@@ -344,7 +347,7 @@ class AnnotationReader:
     ) -> viewer_state.Annotation:
         decoded = np.frombuffer(encoded, dtype=self._dtype, count=1)[0]
         geom = decoded["geometry"]
-        props = [decoded[f"property{i}"] for i in range(len(self.properties))]
+        props = [decoded[field] for field in self._property_fields]
         offset = decoded.nbytes
         segments = []
         for i in range(len(self.relationships)):
@@ -373,12 +376,14 @@ class AnnotationReader:
             )
         constructor = _ANNOTATION_TYPE_CONSTRUCTORS[self.annotation_type]
         rank = self.coordinate_space.rank
-        num_properties = len(self.properties)
+        # Index each field column once rather than each field of each record.
+        geometry = decoded["geometry"]
+        property_columns = [decoded[field] for field in self._property_fields]
         return [
             constructor(
-                decoded[annotation_i]["geometry"],
+                geometry[annotation_i],
                 rank,
-                [decoded[annotation_i][f"property{i}"] for i in range(num_properties)],
+                [column[annotation_i] for column in property_columns],
                 None,
                 str(ids[annotation_i]),
             )
@@ -115,14 +115,12 @@ class Tool:
             modify_state_for_body(prefetch_state, self.bodies[prefetch_index])
             prefetch_states.append(prefetch_state)
 
+        label = self.state.body_labels.get(body.segment_id, "")
         with self.viewer.config_state.txn() as s:
             s.prefetch = [
                 neuroglancer.PrefetchState(state=prefetch_state, priority=-i)
                 for i, prefetch_state in enumerate(prefetch_states)
             ]
-
-        label = self.state.body_labels.get(body.segment_id, "")
-        with self.viewer.config_state.txn() as s:
             s.status_messages["status"] = (
                 "[Segment %d/%d  : %d/%d voxels labeled = %.3f fraction] label=%s"
                 % (
@@ -30,7 +30,7 @@ from . import (
     viewer_config_state,
     viewer_state,
 )
-from .json_utils import decode_json, encode_json, json_encoder_default
+from .json_utils import encode_json, json_encoder_default, to_plain_json
 from .random_token import make_random_token
 
 try:
@@ -43,10 +43,19 @@ class LocalVolumeManager(trackable_state.ChangeNotifier):
     def __init__(self, token_prefix):
         super().__init__()
         self.volumes = dict()
+        self.volume_keys = dict()
         self.__token_prefix = token_prefix
+        # Volumes are only referenced from the state via their volume key, so a
+        # single pattern locates all of them in one pass over the state.
+        self.__volume_key_pattern = re.compile(
+            re.escape(json.dumps(token_prefix)[1:-1]) + r"(\w+)"
+        )
 
     def register_volume(self, v):
         if v.token not in self.volumes:
+            # `volume_keys` is updated before `volumes` here, and after it in
+            # `update`, so every token in `volumes` always has a key.
+            self.volume_keys[v.token] = self.__token_prefix + v.token
             self.volumes[v.token] = v
             self._dispatch_changed_callbacks()
         if isinstance(v, local_volume.LocalVolume):
@@ -59,16 +68,16 @@ class LocalVolumeManager(trackable_state.ChangeNotifier):
         return self.__token_prefix + v.token
 
     def update(self, json_str):
-        pattern = "|".join(self.volumes)
-        present_tokens = set()
-        for m in re.finditer(pattern, json_str):
-            present_tokens.add(m.group(0))
+        if not self.volumes:
+            return
+        present_tokens = set(self.__volume_key_pattern.findall(json_str))
         volumes_to_delete = []
         for x in self.volumes:
             if x not in present_tokens:
                 volumes_to_delete.append(x)
         for x in volumes_to_delete:
             del self.volumes[x]
+            del self.volume_keys[x]
         if volumes_to_delete:
             self._dispatch_changed_callbacks()
 
@@ -351,22 +360,20 @@ class ViewerCommonBase:
 
     def _handle_volumes_changed(self):
         volumes = self.volume_manager.volumes
-        for key in volumes:
-            if key not in self.__watched_volumes:
-                volume = volumes[key]
-                self.__watched_volumes[key] = volume
-                volume.add_changed_callback(self._update_source_generations)
-        keys_to_remove = [key for key in self.__watched_volumes if key not in volumes]
-        for key in keys_to_remove:
-            volume = self.__watched_volumes.pop(key)
+        watched_volumes = self.__watched_volumes
+        for key in volumes.keys() - watched_volumes.keys():
+            volume = watched_volumes[key] = volumes[key]
+            volume.add_changed_callback(self._update_source_generations)
+        for key in watched_volumes.keys() - volumes.keys():
+            volume = watched_volumes.pop(key)
             volume.remove_changed_callback(self._update_source_generations)
 
     def _update_source_generations(self):
         def func(s):
-            volume_manager = self.volume_manager
+            volume_keys = self.volume_manager.volume_keys
             s.source_generations = {
-                volume_manager.get_volume_key(x): x.change_count
-                for x in self.volume_manager.volumes.values()
+                volume_keys[token]: volume.change_count
+                for token, volume in self.volume_manager.volumes.items()
             }
 
         self.config_state.retry_txn(func, lock=True)
@@ -380,7 +387,7 @@ class ViewerCommonBase:
                     return self.volume_manager.register_volume(x)
                 return json_encoder_default(x)
 
-            new_state = decode_json(json.dumps(new_state, default=encoder))
+            new_state = to_plain_json(new_state, encoder)
         return new_state
 
     def txn(self):
@@ -17,7 +17,6 @@ import contextlib
 import re
 import sys
 import threading
-import time
 from collections.abc import Callable, Sequence
 from typing import TYPE_CHECKING
 
@@ -180,10 +179,20 @@ class Webdriver(WebdriverBase):
 
     def sync(self):
         """Wait until client is ready."""
-        while True:
-            new_state = self.viewer.screenshot().viewer_state
-            # Ensure self.viewer.state has also been updated to the new state.
-            # The state sent in the screenshot reply can be newer.
-            if new_state == self.viewer.state:
-                return new_state
-            time.sleep(0.1)
+        state_changed = threading.Event()
+        # Unsynchronized viewers have no shared state to be notified about.
+        shared_state = getattr(self.viewer, "shared_state", None)
+        if shared_state is not None:
+            shared_state.add_changed_callback(state_changed.set)
+        try:
+            while True:
+                state_changed.clear()
+                new_state = self.viewer.screenshot().viewer_state
+                # Ensure self.viewer.state has also been updated to the new state.
+                # The state sent in the screenshot reply can be newer.
+                if new_state == self.viewer.state:
+                    return new_state
+                state_changed.wait(0.1)
+        finally:
+            if shared_state is not None:
+                shared_state.remove_changed_callback(state_changed.set)
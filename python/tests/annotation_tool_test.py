@@ -18,7 +18,7 @@ import numpy as np
 import pytest
 
 
-def setup_viewer(viewer):
+def setup_viewer(viewer, tool):
     with viewer.txn() as s:
         s.dimensions = neuroglancer.CoordinateSpace(
             names=["x", "y", "z"], units="nm", scales=[1, 1, 1]
@@ -44,6 +44,7 @@ def setup_viewer(viewer):
         s.cross_section_scale = 1e-6
         s.show_axis_lines = False
         s.selected_layer.layer = "a"
+        s.layers["a"].tool = tool
 
 
 @pytest.mark.parametrize(
@@ -68,10 +69,8 @@ def setup_viewer(viewer):
 def test_annotate(webdriver, tool, tool_class, annotation_class, num_clicks):
     from selenium.webdriver.common.keys import Keys
 
-    setup_viewer(viewer=webdriver.viewer)
-    with webdriver.viewer.txn() as s:
-        s.layers["a"].tool = tool
-        assert isinstance(s.layers["a"].tool, tool_class)
+    setup_viewer(viewer=webdriver.viewer, tool=tool)
+    assert isinstance(webdriver.viewer.state.layers["a"].tool, tool_class)
     webdriver.sync()
     chain = webdriver.action_chain().key_down(Keys.CONTROL)
     for i in range(num_clicks):
@@ -0,0 +1,60 @@
+# @license
+# Copyright 2025 Google Inc.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for json_utils.py"""
+
+import json
+
+import numpy as np
+import pytest
+from neuroglancer.json_utils import decode_json, json_encoder_default, to_plain_json
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        "abc",
+        [1, 2.5, True, None],
+        (1, (2, 3)),
+        {"a": {"b": [1, 2]}, 1: "int key", 2.5: "float key", None: "null key"},
+        {True: 1, False: 0},
+        np.array([1, 2, 3], dtype=np.uint64),
+        np.array([0.5, 1.5], dtype=np.float32),
+        {"x": np.float64(1.5), "y": np.int32(3), "z": {1, 2}},
+        2**64,
+        float("inf"),
+    ],
+)
+def test_to_plain_json_matches_round_trip(value):
+    expected = decode_json(json.dumps(value, default=json_encoder_default))
+    assert to_plain_json(value) == expected
+
+
+def test_to_plain_json_custom_default():
+    class Custom:
+        pass
+
+    def default(x):
+        if isinstance(x, Custom):
+            return {"custom": (1, 2)}
+        return json_encoder_default(x)
+
+    assert to_plain_json({"a": [Custom()]}, default) == {"a": [{"custom": [1, 2]}]}
+
+
+def test_to_plain_json_unsupported():
+    with pytest.raises(TypeError):
+        to_plain_json(object())
+    with pytest.raises(TypeError):
+        to_plain_json({(1, 2): 3})
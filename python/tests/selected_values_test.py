@@ -13,19 +13,21 @@
 # limitations under the License.
 """Tests that selected values can be retrieved from actions."""
 
-import threading
+import queue
 
 import neuroglancer
 import numpy as np
 import pytest
 
+_XYZ_NM = neuroglancer.CoordinateSpace(
+    names=["x", "y", "z"], units="nm", scales=[1, 1, 1]
+)
+
 
 def setup_viewer(viewer, dtype, value, layer_type):
     a = np.array([[[value]]], dtype=dtype)
     with viewer.txn() as s:
-        s.dimensions = neuroglancer.CoordinateSpace(
-            names=["x", "y", "z"], units="nm", scales=[1, 1, 1]
-        )
+        s.dimensions = _XYZ_NM
         s.layers.append(
             name="a",
             layer=layer_type(
@@ -39,14 +41,8 @@ def setup_viewer(viewer, dtype, value, layer_type):
 
 
 def get_selected_value(webdriver):
-    event = threading.Event()
-    result = [None]
-
-    def my_action(s):
-        result[0] = s
-        event.set()
-
-    webdriver.viewer.actions.add("my-action", my_action)
+    result = queue.SimpleQueue()
+    webdriver.viewer.actions.add("my-action", result.put)
     with webdriver.viewer.config_state.txn() as s:
         s.show_ui_controls = False
         s.show_panel_borders = False
@@ -55,9 +51,8 @@ def get_selected_value(webdriver):
     webdriver.action_chain().move_to_element_with_offset(
         webdriver.root_element, 300, 300
     ).click().perform()
-    event.wait()
-    action_state = result[0]
-    assert action_state is not None
+    action_state = result.get()
+    assert result.empty()
     np.testing.assert_array_equal(
         np.floor(action_state.mouse_voxel_coordinates), [0, 0, 0]
     )
@@ -0,0 +1,72 @@
+# @license
+# Copyright 2025 Google Inc.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for viewer_base.py"""
+
+import neuroglancer
+import numpy as np
+from neuroglancer import viewer_base
+from neuroglancer.json_utils import encode_json
+
+
+def test_local_volume_manager_update():
+    manager = viewer_base.LocalVolumeManager("viewer.")
+    a = neuroglancer.LocalVolume(np.zeros((1, 1, 1), dtype=np.uint8))
+    b = neuroglancer.LocalVolume(np.zeros((1, 1, 1), dtype=np.uint8))
+    url_a = manager.register_volume(a)
+    url_b = manager.register_volume(b)
+    assert set(manager.volumes) == {a.token, b.token}
+    assert manager.volume_keys == {
+        a.token: "viewer." + a.token,
+        b.token: "viewer." + b.token,
+    }
+
+    manager.update(encode_json({"layers": [{"source": url_a}, {"source": url_b}]}))
+    assert set(manager.volumes) == {a.token, b.token}
+
+    # A bare token that is not part of a volume key does not keep a volume alive.
+    manager.update(encode_json({"layers": [{"source": url_a}], "other": b.token}))
+    assert set(manager.volumes) == {a.token}
+    assert set(manager.volume_keys) == {a.token}
+
+    manager.update(encode_json({}))
+    assert manager.volumes == {}
+    assert manager.volume_keys == {}
+
+
+def test_transform_viewer_state_registers_volumes():
+    viewer = viewer_base.UnsynchronizedViewerBase(token="viewer")
+    volume = neuroglancer.LocalVolume(np.zeros((1, 1, 1), dtype=np.uint8))
+    with viewer.txn() as s:
+        s.layers["a"] = neuroglancer.ImageLayer(source=volume)
+    raw_state = viewer.raw_state
+    assert raw_state["layers"][0]["source"] == [
+        {"url": f"python://volume/viewer.{volume.token}"}
+    ]
+    assert viewer.volume_manager.volumes == {volume.token: volume}
+
+
+def test_volume_changes_update_source_generations():
+    viewer = viewer_base.UnsynchronizedViewerBase(token="viewer")
+    volume = neuroglancer.LocalVolume(np.zeros((1, 1, 1), dtype=np.uint8))
+    key = viewer.volume_manager.get_volume_key(volume)
+    with viewer.txn() as s:
+        s.layers["a"] = neuroglancer.ImageLayer(source=volume)
+    # Transforming the state registers the volume with the volume manager.
+    viewer._transform_viewer_state(viewer.state)
+    volume.invalidate()
+    assert viewer.config_state.state.source_generations.to_json() == {key: 1}
+    # Once unregistered, the volume is no longer watched.
+    viewer.volume_manager.update("{}")
+    volume.invalidate()
+    assert viewer.config_state.state.source_generations.to_json() == {key: 1}
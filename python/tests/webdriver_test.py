@@ -0,0 +1,57 @@
+# @license
+# Copyright 2025 Google Inc.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for webdriver.py that do not require a browser."""
+
+import threading
+import time
+import types
+
+import neuroglancer
+from neuroglancer import viewer_base, webdriver
+
+
+def _make_webdriver(viewer):
+    # Bypass __init__, which launches a browser.
+    driver = object.__new__(webdriver.Webdriver)
+    driver.viewer = viewer
+    return driver
+
+
+def test_sync_wakes_on_state_change():
+    viewer = viewer_base.ViewerBase()
+    client_state = neuroglancer.ViewerState({"layout": "xy"})
+    timers = []
+
+    def screenshot():
+        if not timers:
+            # The client state reaches the Python side shortly after the reply.
+            timer = threading.Timer(0.01, viewer.set_state, [client_state])
+            timers.append(timer)
+            timer.start()
+        return types.SimpleNamespace(viewer_state=client_state)
+
+    viewer.screenshot = screenshot
+    num_callbacks = len(viewer.shared_state._ChangeNotifier__changed_callbacks)
+    start_time = time.time()
+    assert _make_webdriver(viewer).sync() == client_state
+    # Without the change notification, the retry would wait the full 0.1 s.
+    assert time.time() - start_time < 0.09
+    assert len(viewer.shared_state._ChangeNotifier__changed_callbacks) == num_callbacks
+
+
+def test_sync_unsynchronized_viewer():
+    viewer = viewer_base.UnsynchronizedViewerBase()
+    viewer.set_state({"layout": "xy"})
+    viewer.screenshot = lambda: types.SimpleNamespace(viewer_state=viewer.state)
+    assert _make_webdriver(viewer).sync() == viewer.state